@@ -2,18 +2,27 @@
 Discrete-time coined quantum walk on graphs.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from qiskit.circuit import QuantumCircuit
+from qiskit.circuit.library import QFT, UnitaryGate
 from qiskit_aer import AerSimulator
 
 
+@lru_cache(maxsize=None)
 def grover_coin(n_coin_qubits):
     """
     Grover diffusion operator as a coin for the quantum walk.
     Acts on the coin register.
+
+    The result is cached per coin size and returned read-only.
     """
     dim = 2 ** n_coin_qubits
-    coin = (2.0 / dim) * np.ones((dim, dim)) - np.eye(dim)
+    # (2/dim) J - I filled in place, without the ones/eye temporaries
+    coin = np.full((dim, dim), 2.0 / dim)
+    coin.flat[::dim + 1] = 2.0 / dim - 1.0
+    coin.flags.writeable = False
     return coin
 
 
@@ -22,7 +31,31 @@ def hadamard_coin():
     return np.array([[1, 1], [1, -1]]) / np.sqrt(2)
 
 
-def build_coined_walk_circuit(n_position_qubits, n_steps, coin_type='grover'):
+def shift_operator(n_position_qubits):
+    """
+    Coin-controlled shift |c>|x> -> |c>|x + 1> if c=1, |c>|x - 1> if c=0.
+
+    Positions wrap modulo 2^n. The addition is done in the Fourier basis,
+    where adding a constant is a layer of single-qubit phases, so only
+    the phases need to be controlled on the coin (qubit 0).
+    """
+    n = n_position_qubits
+    qc = QuantumCircuit(n + 1, name='S')
+    pos_qubits = list(range(1, n + 1))
+
+    qc.compose(QFT(n).decompose(), pos_qubits, inplace=True)
+    for k, q in enumerate(pos_qubits):
+        theta = 2 * np.pi / 2 ** (n - k)
+        # -1 unconditionally, +2 when the coin is |1>
+        qc.p(-theta, q)
+        qc.cp(2 * theta, 0, q)
+    qc.compose(QFT(n, inverse=True).decompose(), pos_qubits, inplace=True)
+
+    return qc
+
+
+def build_coined_walk_circuit(n_position_qubits, n_steps, coin_type='grover',
+                              measure=True):
     """
     Build a discrete-time coined quantum walk circuit.
 
@@ -33,6 +66,7 @@ def build_coined_walk_circuit(n_position_qubits, n_steps, coin_type='grover'):
         n_position_qubits: number of qubits for position register
         n_steps: number of walk steps
         coin_type: 'grover' or 'hadamard'
+        measure: append measurements of the position register
 
     Returns:
         QuantumCircuit for the walk
@@ -44,50 +78,74 @@ def build_coined_walk_circuit(n_position_qubits, n_steps, coin_type='grover'):
     coin_qubits = list(range(n_coin))
     pos_qubits = list(range(n_coin, n_total))
 
+    shift = shift_operator(n_position_qubits)
+    if coin_type != 'hadamard':
+        coin_gate = UnitaryGate(grover_coin(n_coin), label='C')
+
     # initial superposition on coin
     for q in coin_qubits:
         qc.h(q)
 
     for step in range(n_steps):
         # coin operator
-        if coin_type == 'hadamard' and n_coin == 1:
+        if coin_type == 'hadamard':
             qc.h(coin_qubits[0])
         else:
-            coin_matrix = grover_coin(n_coin)
-            qc.unitary(coin_matrix, coin_qubits, label=f'C{step}')
+            qc.append(coin_gate, coin_qubits)
 
-        # conditional shift: increment position if coin=|1>
-        # simplified shift using controlled increment
-        qc.cx(coin_qubits[0], pos_qubits[0])
-        for i in range(1, len(pos_qubits)):
-            qc.mcx(coin_qubits[:1] + pos_qubits[:i], pos_qubits[i])
+        # conditional shift: move right if coin=|1>, left if coin=|0>
+        qc.compose(shift, coin_qubits[:1] + pos_qubits, inplace=True)
 
     # measure position register
-    for i, q in enumerate(pos_qubits):
-        qc.measure(q, i)
+    if measure:
+        for i, q in enumerate(pos_qubits):
+            qc.measure(q, i)
 
     return qc
 
 
 def run_coined_walk(n_position_qubits, n_steps, coin_type='grover',
-                     shots=8192, seed=42):
+                     shots=None, seed=42, circuit=None):
     """
     Execute a coined quantum walk and return position distribution.
 
-    Returns:
-        dict with 'positions' (array) and 'probabilities' (array)
-    """
-    qc = build_coined_walk_circuit(n_position_qubits, n_steps, coin_type)
+    With shots=None the exact position distribution is read from the
+    final statevector; otherwise it is estimated from measurement counts.
 
-    backend = AerSimulator(seed_simulator=seed)
-    job = backend.run(qc, shots=shots)
-    counts = job.result().get_counts()
+    Passing a previous result's 'circuit' back as circuit (with the same
+    shots mode) skips rebuilding the walk on repeated runs.
 
+    Returns:
+        dict with 'positions' (array), 'probabilities' (array) and
+        'circuit', the walk circuit that was run: with a save_probabilities
+        instruction when shots is None, with measurements otherwise
+    """
     n_positions = 2 ** n_position_qubits
-    probabilities = np.zeros(n_positions)
-    for bitstring, count in counts.items():
-        idx = int(bitstring, 2)
-        probabilities[idx] = count / shots
+
+    if shots is None:
+        backend = AerSimulator(method='statevector', seed_simulator=seed)
+    else:
+        backend = AerSimulator(seed_simulator=seed)
+
+    qc = circuit
+    if qc is None:
+        qc = build_coined_walk_circuit(n_position_qubits, n_steps, coin_type,
+                                       measure=shots is not None)
+        if shots is None:
+            qc.save_probabilities(qc.qubits[-n_position_qubits:], label='p')
+
+    if shots is None:
+        job = backend.run(qc, shots=1)
+        probabilities = job.result().data(0)['p']
+    else:
+        job = backend.run(qc, shots=shots)
+        counts = job.result().get_counts()
+
+        idx = np.array([int(bitstring, 2) for bitstring in counts], dtype=np.int64)
+        values = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+
+        probabilities = np.zeros(n_positions)
+        probabilities[idx] = values / shots
 
     return {
         'positions': np.arange(n_positions),
@@ -3,16 +3,20 @@ Continuous-time quantum walk via Hamiltonian evolution.
 """
 
 import numpy as np
-from scipy.linalg import expm
-import networkx as nx
+from scipy.linalg import eigh
+from scipy.sparse.linalg import expm_multiply
+from scipy.special import jv
+from .graph_utils import adjacency_csr
 
 
 def adjacency_hamiltonian(graph):
     """
     Build the Hamiltonian from the graph adjacency matrix.
     H = -gamma * A where A is the adjacency matrix.
+
+    Returned in sparse CSR form so memory scales with the number of edges.
     """
-    return np.array(nx.adjacency_matrix(graph).todense(), dtype=float)
+    return adjacency_csr(graph)
 
 
 def evolve_continuous_walk(graph, initial_node, time, gamma=1.0):
@@ -37,9 +41,8 @@ def evolve_continuous_walk(graph, initial_node, time, gamma=1.0):
     psi_0 = np.zeros(n, dtype=complex)
     psi_0[initial_node] = 1.0
 
-    # time evolution
-    U = expm(-1j * gamma * A * time)
-    psi_t = U @ psi_0
+    # time evolution: action of the exponential, U is never formed
+    psi_t = expm_multiply(-1j * gamma * time * A, psi_0)
 
     probabilities = np.abs(psi_t) ** 2
 
@@ -49,21 +52,95 @@ def evolve_continuous_walk(graph, initial_node, time, gamma=1.0):
     }
 
 
-def sweep_evolution(graph, initial_node, time_range, gamma=1.0):
+def _sweep_eigh(A, psi_0, times, gamma):
+    """Probabilities at all times from one dense eigendecomposition of A."""
+    A = A.toarray()
+
+    # A is real symmetric and time-independent: diagonalize once and
+    # evaluate exp(-i * gamma * A * t) |initial> for every t together.
+    # With real A and psi_0 the real and imaginary parts of the amplitudes
+    # are V cos(gamma w t) V^T psi_0 and -V sin(gamma w t) V^T psi_0, so
+    # everything stays in real arithmetic
+    w, V = eigh(A.T, driver='evr', overwrite_a=True, check_finite=False)
+    c = V.T @ psi_0
+
+    angles = gamma * np.multiply.outer(times, w)
+    real_amp = (np.cos(angles) * c) @ V.T
+    imag_amp = (np.sin(angles) * c) @ V.T
+    return real_amp ** 2 + imag_amp ** 2
+
+
+def _sweep_chebyshev(A, psi_0, times, gamma):
+    """
+    Probabilities at all times from a Chebyshev expansion of the propagator.
+
+    With the spectrum of A scaled into [-1, 1],
+    exp(-i * tau * x) = J_0(tau) + 2 * sum_k (-i)^k J_k(tau) T_k(x),
+    so one recursion T_k(A) psi_0 serves every time; only the Bessel
+    weights depend on t. Needs sparse matvecs only.
+    """
+    # Gershgorin: the spectrum of A lies within [-max row sum, max row sum]
+    scale = abs(A).sum(axis=1).max()
+    if scale == 0:
+        scale = 1.0
+    A_hat = A / scale
+    tau = gamma * scale * times
+
+    # J_k(tau) decays super-exponentially once k exceeds |tau|
+    tau_max = np.abs(tau).max(initial=0.0)
+    n_terms = int(np.ceil(tau_max + 10 * np.cbrt(tau_max))) + 20
+
+    # Chebyshev vectors T_k(A_hat) psi_0, real for real A and psi_0
+    basis = np.empty((n_terms, psi_0.size))
+    basis[0] = psi_0
+    basis[1] = A_hat @ psi_0
+    for k in range(2, n_terms):
+        basis[k] = 2 * (A_hat @ basis[k - 1]) - basis[k - 2]
+
+    # (-i)^k weights split into real (even k) and imaginary (odd k) parts
+    k = np.arange(n_terms)
+    coeffs = jv(k, tau[:, None])
+    coeffs[:, 1:] *= 2
+    sign = np.where(k % 4 < 2, 1.0, -1.0)
+    real_coeffs = np.where(k % 2 == 0, sign * coeffs, 0.0)
+    imag_coeffs = np.where(k % 2 == 1, -sign * coeffs, 0.0)
+
+    real_amp = real_coeffs @ basis
+    imag_amp = imag_coeffs @ basis
+    return real_amp ** 2 + imag_amp ** 2
+
+
+def sweep_evolution(graph, initial_node, time_range, gamma=1.0, method='eigh'):
     """
     Sweep continuous-time evolution over a range of times.
 
+    Args:
+        graph: networkx Graph
+        initial_node: starting node index
+        time_range: evolution times
+        gamma: coupling constant
+        method: 'eigh' diagonalizes the dense adjacency matrix once;
+            'chebyshev' expands the propagator in Chebyshev polynomials of
+            the sparse adjacency matrix, suited to large sparse graphs
+
     Returns:
         dict with 'times' and 'prob_matrix' (shape: n_times x n_nodes)
     """
     n = graph.number_of_nodes()
-    prob_matrix = np.zeros((len(time_range), n))
+    times = np.asarray(time_range, dtype=float)
+    A = adjacency_hamiltonian(graph)
+
+    psi_0 = np.zeros(n)
+    psi_0[initial_node] = 1.0
 
-    for i, t in enumerate(time_range):
-        result = evolve_continuous_walk(graph, initial_node, t, gamma)
-        prob_matrix[i] = result['probabilities']
+    if method == 'chebyshev':
+        prob_matrix = _sweep_chebyshev(A, psi_0, times, gamma)
+    elif method == 'eigh':
+        prob_matrix = _sweep_eigh(A, psi_0, times, gamma)
+    else:
+        raise ValueError(f"unknown method {method!r}, expected 'eigh' or 'chebyshev'")
 
     return {
-        'times': np.array(time_range),
+        'times': times,
         'prob_matrix': prob_matrix,
     }
@@ -31,29 +31,52 @@ def build_star(n):
     return nx.star_graph(n - 1)
 
 
+def adjacency_csr(graph):
+    """Float CSR adjacency matrix of a graph."""
+    return nx.adjacency_matrix(graph, dtype=float)
+
+
+def _hitting_time_kernel(indptr, indices, start, target, n_trials, max_steps, seed):
+    """
+    Average hitting time of n_trials random walks on a CSR adjacency.
+
+    All trials advance in lockstep; a trial retires when it reaches
+    target or exceeds max_steps. Raises ValueError if a walk reaches a
+    node with no neighbours.
+    """
+    rng = np.random.RandomState(seed)
+    degrees = np.diff(indptr)
+
+    current = np.full(n_trials, start, dtype=np.int64)
+    steps = np.zeros(n_trials, dtype=np.int64)
+    active = np.flatnonzero(current != target)
+
+    while active.size:
+        pos = current[active]
+        if np.any(degrees[pos] == 0):
+            raise ValueError("random walk reached a node with no neighbours")
+        offset = (rng.random_sample(active.size) * degrees[pos]).astype(np.int64)
+        current[active] = indices[indptr[pos] + offset]
+        steps[active] += 1
+        active = active[(current[active] != target) & (steps[active] <= max_steps)]
+
+    return steps.sum() / n_trials
+
+
 def classical_hitting_time(graph, start, target, n_trials=10000, seed=42):
     """
     Estimate classical random walk hitting time via Monte Carlo.
 
     Returns average number of steps to reach target from start.
     """
-    rng = np.random.RandomState(seed)
-    total_steps = 0
     nodes = list(graph.nodes())
     node_to_idx = {node: i for i, node in enumerate(nodes)}
+    max_steps = 10 * len(nodes) ** 2
+
+    adj = nx.to_scipy_sparse_array(graph, nodelist=nodes, format='csr')
 
-    for _ in range(n_trials):
-        current = start
-        steps = 0
-        while current != target:
-            neighbors = list(graph.neighbors(current))
-            current = neighbors[rng.randint(len(neighbors))]
-            steps += 1
-            if steps > 10 * len(nodes) ** 2:
-                break
-        total_steps += steps
-
-    return total_steps / n_trials
+    return _hitting_time_kernel(adj.indptr, adj.indices, node_to_idx[start],
+                                node_to_idx[target], n_trials, max_steps, seed)
 
 
 def get_graph_builders():
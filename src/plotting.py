@@ -1,5 +1,9 @@
 """
 Visualization for quantum walk experiments.
+
+Each plot function draws into a new figure and saves it under save_dir,
+or, when an existing ax is passed, draws into that axis and leaves
+saving to the caller so one figure can be reused across many plots.
 """
 
 import numpy as np
@@ -7,30 +11,41 @@ import matplotlib.pyplot as plt
 from pathlib import Path
 
 
-def plot_walk_distribution(positions, probabilities, title='Quantum Walk Distribution',
-                            save_dir='results'):
-    """Plot position probability distribution of a quantum walk."""
+def _save_figure(fig, save_dir, filename):
+    """Lay out, save and close a figure created by one of the plot functions."""
     save_path = Path(save_dir)
     save_path.mkdir(exist_ok=True)
 
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig.tight_layout()
+    fig.savefig(save_path / filename, dpi=150)
+    plt.close(fig)
+
+
+def plot_walk_distribution(positions, probabilities, title='Quantum Walk Distribution',
+                            save_dir='results', ax=None):
+    """Plot position probability distribution of a quantum walk."""
+    fig = None
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(10, 5))
+
     ax.bar(positions, probabilities, color='#4ECDC4', alpha=0.8, edgecolor='#2C3E50')
     ax.set_xlabel('Position', fontsize=12)
     ax.set_ylabel('Probability', fontsize=12)
     ax.set_title(title, fontsize=13)
     ax.grid(True, alpha=0.3, axis='y')
-    plt.tight_layout()
-    plt.savefig(save_path / 'walk_distribution.png', dpi=150)
-    plt.close()
+
+    if fig is not None:
+        _save_figure(fig, save_dir, 'walk_distribution.png')
+    return ax
 
 
 def plot_search_probability(times, success_probs, optimal_time=None,
-                             save_dir='results'):
+                             save_dir='results', ax=None):
     """Plot success probability over time for quantum walk search."""
-    save_path = Path(save_dir)
-    save_path.mkdir(exist_ok=True)
+    fig = None
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(10, 5))
 
-    fig, ax = plt.subplots(figsize=(10, 5))
     ax.plot(times, success_probs, '-', color='#FF6B6B', linewidth=2)
 
     if optimal_time is not None:
@@ -44,18 +59,19 @@ def plot_search_probability(times, success_probs, optimal_time=None,
     ax.set_ylabel('Success Probability', fontsize=12)
     ax.set_title('Quantum Walk Search: Success Probability vs Time')
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(save_path / 'search_probability.png', dpi=150)
-    plt.close()
+
+    if fig is not None:
+        _save_figure(fig, save_dir, 'search_probability.png')
+    return ax
 
 
 def plot_continuous_walk_evolution(times, prob_matrix, node_labels=None,
-                                    save_dir='results'):
+                                    save_dir='results', ax=None):
     """Plot probability evolution across nodes over time."""
-    save_path = Path(save_dir)
-    save_path.mkdir(exist_ok=True)
+    fig = None
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(12, 6))
 
-    fig, ax = plt.subplots(figsize=(12, 6))
     n_nodes = prob_matrix.shape[1]
     colors = plt.cm.viridis(np.linspace(0, 1, min(n_nodes, 8)))
 
@@ -69,18 +85,19 @@ def plot_continuous_walk_evolution(times, prob_matrix, node_labels=None,
     ax.set_title('Continuous-Time Quantum Walk Evolution')
     ax.legend(fontsize=9, ncol=2)
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(save_path / 'walk_evolution.png', dpi=150)
-    plt.close()
+
+    if fig is not None:
+        _save_figure(fig, save_dir, 'walk_evolution.png')
+    return ax
 
 
 def plot_scaling_comparison(n_nodes, quantum_times, classical_times,
-                             save_dir='results'):
+                             save_dir='results', ax=None):
     """Compare quantum vs classical search scaling."""
-    save_path = Path(save_dir)
-    save_path.mkdir(exist_ok=True)
+    fig = None
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(10, 6))
 
-    fig, ax = plt.subplots(figsize=(10, 6))
     ax.plot(n_nodes, classical_times, 's-', color='#FF6B6B', linewidth=2,
             markersize=8, label='Classical Random Walk')
     ax.plot(n_nodes, quantum_times, 'o-', color='#4ECDC4', linewidth=2,
@@ -91,6 +108,7 @@ def plot_scaling_comparison(n_nodes, quantum_times, classical_times,
     ax.set_title('Search Scaling: Quantum vs Classical')
     ax.legend(fontsize=11)
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(save_path / 'scaling_comparison.png', dpi=150)
-    plt.close()
+
+    if fig is not None:
+        _save_figure(fig, save_dir, 'scaling_comparison.png')
+    return ax
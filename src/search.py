@@ -3,9 +3,14 @@ Quantum walk-based search for marked vertices.
 """
 
 import numpy as np
-from scipy.linalg import expm
-import networkx as nx
-from .graph_utils import adjacency_hamiltonian
+from scipy.linalg import eigh
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import expm_multiply
+from .graph_utils import adjacency_csr
+
+# above this size the dense eigendecomposition is replaced by the
+# action of the sparse propagator on the initial state
+_DENSE_MAX_NODES = 1024
 
 
 def build_search_hamiltonian(graph, marked_vertex, gamma=1.0):
@@ -15,20 +20,21 @@ def build_search_hamiltonian(graph, marked_vertex, gamma=1.0):
 
     The oracle term |w><w| adds energy to the marked state,
     creating a spectral gap that drives the walk toward it.
+
+    Returned in sparse CSR form; memory scales with the number of edges.
     """
     n = graph.number_of_nodes()
-    A = np.array(nx.adjacency_matrix(graph).todense(), dtype=float)
+    A = adjacency_csr(graph)
 
-    # oracle projector
-    oracle = np.zeros((n, n))
-    oracle[marked_vertex, marked_vertex] = 1.0
+    # oracle projector, a single stored entry
+    oracle = csr_matrix(([1.0], ([marked_vertex], [marked_vertex])), shape=(n, n))
 
     H = -gamma * A + oracle
     return H
 
 
 def search_continuous_walk(graph, marked_vertex, gamma=None, time=None,
-                            n_time_steps=200):
+                            n_time_steps=200, out=None):
     """
     Search for a marked vertex using continuous-time quantum walk.
 
@@ -41,6 +47,8 @@ def search_continuous_walk(graph, marked_vertex, gamma=None, time=None,
         gamma: coupling constant (auto-computed if None)
         time: total evolution time (auto-computed if None)
         n_time_steps: resolution of time sweep
+        out: optional preallocated array of length n_time_steps that
+            receives the success probabilities
 
     Returns:
         dict with 'optimal_time', 'max_probability', 'prob_over_time'
@@ -55,16 +63,34 @@ def search_continuous_walk(graph, marked_vertex, gamma=None, time=None,
 
     times = np.linspace(0, time, n_time_steps)
 
+    success_probs = np.empty(n_time_steps) if out is None else out
+
     # initial state: uniform superposition
     psi_0 = np.ones(n, dtype=complex) / np.sqrt(n)
 
     H = build_search_hamiltonian(graph, marked_vertex, gamma)
 
-    success_probs = np.zeros(len(times))
-    for i, t in enumerate(times):
-        U = expm(-1j * H * t)
-        psi_t = U @ psi_0
-        success_probs[i] = np.abs(psi_t[marked_vertex]) ** 2
+    if n <= _DENSE_MAX_NODES:
+        H = H.toarray()
+
+        # H is Hermitian and time-independent: diagonalize once and evaluate
+        # <w|exp(-iHt)|psi_0> = sum_k V[w, k] exp(-i w_k t) <v_k|psi_0> for all t.
+        # H is a fresh symmetric array, so H.T is a Fortran-ordered view that
+        # LAPACK may overwrite without a copy
+        w, V = eigh(H.T, driver='evr', overwrite_a=True, check_finite=False)
+        c = V.conj().T @ psi_0
+        weights = V[marked_vertex, :] * c
+
+        phases = np.exp(-1j * np.outer(times, w))
+        np.abs(phases @ weights, out=success_probs)
+    else:
+        # whole trajectory over the evenly spaced grid in one call,
+        # each step costs O(nnz) instead of a dense factorization
+        psi_traj = expm_multiply(-1j * H, psi_0, start=0, stop=time,
+                                 num=n_time_steps, endpoint=True)
+        np.abs(psi_traj[:, marked_vertex], out=success_probs)
+
+    success_probs **= 2
 
     optimal_idx = np.argmax(success_probs)
 
@@ -87,11 +113,16 @@ def benchmark_search(graph_builder, node_counts, marked_vertex=0,
     optimal_times = []
     max_probs = []
 
+    # the time grid has the same length for every size, so one buffer
+    # serves all searches
+    success_probs = np.empty(n_time_steps)
+
     for n in node_counts:
         print(f"  Searching on {n} nodes...", end=" ")
         graph = graph_builder(n)
         result = search_continuous_walk(graph, marked_vertex,
-                                         n_time_steps=n_time_steps)
+                                         n_time_steps=n_time_steps,
+                                         out=success_probs)
         optimal_times.append(result['optimal_time'])
         max_probs.append(result['max_probability'])
         print(f"P={result['max_probability']:.4f} at t={result['optimal_time']:.2f}")